@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.database.database import Database
 from app.services.routes import ChatService
-from app.schemas import UserPromptSchema, ChatResponseSchema
+from app.schemas import ChatPromptSchema, ChatResponseSchema
 from app.types.enum.http_status import HTTPStatus
 from fastapi import Request
 
@@ -15,14 +16,15 @@ router = APIRouter()
     },
 )
 async def chat_endpoint(
-    user_prompt: UserPromptSchema,
+    user_prompt: ChatPromptSchema,
     request: Request,
 ) -> ChatResponseSchema:
     database = Database()
     db = database.get_session()
+    async_db = database.get_async_session()
 
     try:
-        chat_service = ChatService(db, user_prompt, request)
+        chat_service = ChatService(db, user_prompt, request, async_db)
         chat_result = await chat_service.handle_chat()
 
         if chat_result["status"] != HTTPStatus.OK.value:
@@ -49,3 +51,25 @@ async def chat_endpoint(
 
     finally:
         db.close()
+        await async_db.close()
+
+
+@router.post("/chat/stream")
+async def chat_stream_endpoint(
+    user_prompt: ChatPromptSchema,
+    request: Request,
+) -> StreamingResponse:
+    database = Database()
+    db = database.get_session()
+    async_db = database.get_async_session()
+    chat_service = ChatService(db, user_prompt, request, async_db)
+
+    async def event_stream():
+        try:
+            async for frame in chat_service.handle_chat_stream():
+                yield frame
+        finally:
+            db.close()
+            await async_db.close()
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
@@ -1,5 +1,10 @@
+import gc
+
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from app.api.router import router
+from app.config import THREAD_POOL_SIZE
 from app.llm.blue_vi_system import BlueViGptModel
 from app.middleware.middleware import CustomMiddleware
 from contextlib import asynccontextmanager
@@ -9,16 +14,27 @@ from contextlib import asynccontextmanager
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup event
+    # Model calls are native coroutines, the thread pool only serves the
+    # remaining sync work, so size it to keep other endpoints from starving
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        THREAD_POOL_SIZE
+    )
     blue_vi_gpt = BlueViGptModel()
     app.state.model = blue_vi_gpt
+    await blue_vi_gpt.warm_up()
+    # Move the long-lived startup objects (model client, tokenizer, routers)
+    # out of the generational GC so request-time collections stay cheap,
+    # and collect less often to amortise the cost across requests.
+    gc.freeze()
+    gc.set_threshold(50000, 50, 50)
     yield
-    blue_vi_gpt.close()
+    await blue_vi_gpt.close()
     pass
 
 
 # Create FastAPI app with lifespan context
 def create_app() -> FastAPI:
-    app = FastAPI(lifespan=lifespan)
+    app = FastAPI(default_response_class=ORJSONResponse, lifespan=lifespan)
     # noinspection PyTypeChecker
     app.add_middleware(CustomMiddleware)
     app.include_router(router)
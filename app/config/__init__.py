@@ -15,4 +15,6 @@ from .config_env import (
     REDIS_PORT,
     GPT_ENDPOINT_URL,
     MODEL_NAME,
+    THREAD_POOL_SIZE,
+    PROMPT_CACHE_SIZE,
 )
@@ -42,6 +42,8 @@ API_URL = EnvConfig.get("API_URL")
 GPT_ENDPOINT_URL = EnvConfig.get("GPT_ENDPOINT_URL")
 LLM_MAX_TOKEN = EnvConfig.get_int("LLM_MAX_TOKEN", 2048)
 MAX_HISTORY_WINDOW_SIZE = EnvConfig.get_int("MAX_HISTORY_WINDOW_SIZE", 1024)
+THREAD_POOL_SIZE = EnvConfig.get_int("THREAD_POOL_SIZE", 128)
+PROMPT_CACHE_SIZE = EnvConfig.get_int("PROMPT_CACHE_SIZE", 1024)
 
 REDIS_HOST = EnvConfig.get("REDIS_HOST")
 REDIS_PORT = EnvConfig.get_int("REDIS_PORT")
@@ -6,12 +6,20 @@ from app.config.config_env import (
     DB_DATABASE,
 )
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, Session
 from .base import Base
 from typing import Optional
 
 
 class Database:
+    # Shared by all instances so the async connection pool outlives a request
+    _async_engine: Optional[AsyncEngine] = None
+
     def __init__(self) -> None:
         self.engine = None
         self.Session: Optional[sessionmaker] = None
@@ -39,6 +47,18 @@ class Database:
             raise Exception("Database is not connected.")
         return self.Session()
 
+    @classmethod
+    def get_async_engine(cls) -> AsyncEngine:
+        """Get the shared async engine, creating it on first use."""
+        if cls._async_engine is None:
+            db_url = f"mysql+aiomysql://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DATABASE}"
+            cls._async_engine = create_async_engine(db_url, pool_pre_ping=True)
+        return cls._async_engine
+
+    def get_async_session(self) -> AsyncSession:
+        """Get a new async database session."""
+        return AsyncSession(self.get_async_engine(), expire_on_commit=False)
+
     def disconnect(self):
         if self.engine:
             self.engine.dispose()
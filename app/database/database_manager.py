@@ -1,4 +1,5 @@
 from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.database.model_managers import (
     UserManager,
@@ -10,10 +11,13 @@ from app.model import Message, Conversation, User, UserConversation
 
 
 class DatabaseManager:
-    def __init__(self, db: Session) -> None:
+    def __init__(
+        self, db: Session, async_db: Optional[AsyncSession] = None
+    ) -> None:
         self.db: Session = db
+        self.async_db: Optional[AsyncSession] = async_db
         self.user_manager = UserManager(db)
-        self.message_manager = MessageManager(db)
+        self.message_manager = MessageManager(db, async_db)
         self.conversation_manager = ConversationManager(db)
         self.user_conversations_manager = UserConversationManager(db)
 
@@ -69,11 +73,11 @@ class DatabaseManager:
             user_conversation_id, content, message_type, role
         )
 
-    def get_messages_by_user_conversation_id(
-        self, user_conversation_id: int
+    async def get_messages_by_user_conversation_id(
+        self, user_conversation_id: int, limit: int = 10
     ) -> List[Message]:
-        return self.message_manager.get_messages_by_user_conversation_id(
-            user_conversation_id
+        return await self.message_manager.get_messages_by_user_conversation_id(
+            user_conversation_id, limit
         )
 
     def get_sensitive_messages(
@@ -89,6 +93,9 @@ class DatabaseManager:
     def flag_message(self, message_id: int):
         return self.message_manager.flag_message(message_id)
 
+    async def flag_message_async(self, message_id: int) -> None:
+        await self.message_manager.flag_message_async(message_id)
+
     # User Conversations
     def get_user_conversation(
         self, user_id: int, conversation_id: int
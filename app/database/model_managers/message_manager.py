@@ -1,13 +1,17 @@
 from datetime import datetime, timezone
 from typing import Optional, List
 
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from app.database.database import Database
 from app.model import Message, UserConversation
 
 
 class MessageManager:
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, async_db: Optional[AsyncSession] = None):
         self.db = db
+        self.async_db = async_db
 
     def get_messages_for_conversation(
         self, user_conversation_id: int
@@ -37,16 +41,19 @@ class MessageManager:
         self.db.refresh(new_message)
         return new_message
 
-    def get_messages_by_user_conversation_id(
-        self, user_conversation_id: int
+    async def get_messages_by_user_conversation_id(
+        self, user_conversation_id: int, limit: int = 10
     ) -> List[Message]:
-        return (
-            self.db.query(Message)
-            .filter(Message.user_conversation_id == user_conversation_id)
+        """Return the latest messages of a conversation, oldest first."""
+        result = await self.async_db.execute(
+            select(Message)
+            .where(Message.user_conversation_id == user_conversation_id)
             .order_by(Message.created_at.desc())
-            .limit(10)
-            .all()
+            .limit(limit)
         )
+        messages = list(result.scalars().all())
+        messages.reverse()
+        return messages
 
     def get_messages_by_conversation_id(
         self, conversation_id: int
@@ -90,3 +97,15 @@ class MessageManager:
             return message
         else:
             return None
+
+    async def flag_message_async(self, message_id: int) -> None:
+        """Flag a message as sensitive in a session of its own."""
+        # Runs as a background task, so it must not share the request
+        # session, which the route may close while the update is in flight
+        async with AsyncSession(Database.get_async_engine()) as session:
+            await session.execute(
+                update(Message)
+                .where(Message.id == message_id)
+                .values(sensitive_data_flag=True)
+            )
+            await session.commit()
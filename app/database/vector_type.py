@@ -0,0 +1,33 @@
+from array import array
+from typing import Optional, Sequence
+
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+
+class Float32Vector(TypeDecorator):
+    """
+    Stores an embedding as packed float32 bytes instead of JSON.
+
+    Loading a vector is a single buffer copy rather than a JSON parse, and
+    the returned array supports the buffer protocol, so it can be wrapped
+    with numpy.frombuffer without copying.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(
+        self, value: Optional[Sequence[float]], dialect
+    ) -> Optional[bytes]:
+        if value is None:
+            return None
+        return array('f', value).tobytes()
+
+    def process_result_value(
+        self, value: Optional[bytes], dialect
+    ) -> Optional[array]:
+        if value is None:
+            return None
+        vector = array('f')
+        vector.frombytes(value)
+        return vector
@@ -1,10 +1,14 @@
+import asyncio
 import logging
-from typing import List, Tuple
+from typing import AsyncIterator, List, Optional, Set, Tuple
+
+from pydantic import BaseModel
+
 from app.client import PhxApiClient
 from app.config import MAX_HISTORY_WINDOW_SIZE
 from app.database import DatabaseManager
 from app.model import Message
-from app.schemas import GptResponseSchema
+from app.schemas import DecisionInstruction, GptResponseSchema
 from app.services.cache import CacheService
 from app.types.enum.gpt_response_handling import (
     BlueViResponseHandling,
@@ -12,7 +16,23 @@ from app.types.enum.gpt_response_handling import (
 from app.types.enum.instruction import InstructionList, CRUD
 
 from app.types.enum.http_status import HTTPStatus
-from app.utils import convert_conversation_history_to_tuples, TokenUtils
+from app.utils import (
+    coalesce_chunks,
+    convert_conversation_history_to_tuples,
+    TokenUtils,
+)
+
+logger = logging.getLogger(__name__)
+
+# Holds fire-and-forget tasks so they are not garbage collected mid-flight
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _on_background_task_done(task: asyncio.Task) -> None:
+    """Release a finished background task and log its failure, if any."""
+    _background_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task failed: %s", task.exception())
 
 
 class BlueViAgent:
@@ -36,49 +56,49 @@ class BlueViAgent:
             message.user_conversation_id
         )
         if cached_history:
-            logging.info("Fetched conversation history from Redis cache.")
+            logger.info("Fetched conversation history from Redis cache.")
             conversation_history_list = convert_conversation_history_to_tuples(
                 cached_history
             )
-            for role, content in conversation_history_list:
-                logging.info(
-                    f"Mapped Message -> Role: {role}, Content: {content}"
-                )
-            return conversation_history_list
+            return self.token_utils.trim_history_to_fit_tokens(
+                conversation_history_list
+            )
         else:
             # If not in cache, get from the database and store in Redis
             conversation_history = (
-                self.db_manager.get_messages_by_user_conversation_id(
+                await self.db_manager.get_messages_by_user_conversation_id(
                     message.user_conversation_id
                 )
             )
-            logging.info("Fetched conversation history from DB.")
+            logger.info("Fetched conversation history from DB.")
             conversation_history_list = convert_conversation_history_to_tuples(
                 conversation_history
             )
-            for role, content in conversation_history_list:
-                logging.info(f"Message -> Role: {role}, Content: {content}")
 
             # Cache the fetched history for future use
             await self.cache_service.cache_conversation_history(
                 message.user_conversation_id, conversation_history
             )
-            logging.info("Fetched conversation history from DB and cached it.")
+            logger.info("Fetched conversation history from DB and cached it.")
             return self.token_utils.trim_history_to_fit_tokens(
                 conversation_history_list
             )
 
-    def handle_operation_instruction(
+    async def handle_operation_instruction(
         self,
         conversation_history: List[Tuple[str, str]],
         user_uuid: str,
         crud: CRUD,
+        operation_schema: Optional[BaseModel] = None,
     ) -> GptResponseSchema:
         """Handle operation-specific instructions."""
         try:
-            operation_schema = self.model.assistant.handle_phx_operation(
-                conversation_history, crud
-            )
+            if operation_schema is None:
+                operation_schema = (
+                    await self.model.assistant.handle_phx_operation(
+                        conversation_history, crud
+                    )
+                )
             operation_schema = vars(operation_schema)
             operation_schema.pop("uuid", None)
 
@@ -91,9 +111,9 @@ class BlueViAgent:
                         details=operation_schema,
                     )
                 )
-                response = self.model.assistant.generate_user_response_with_custom_instruction(
+                response = await self.model.assistant.generate_user_response_with_custom_instruction(
                     conversation_history,
-                    instruction=f"{instruction}",
+                    instruction=instruction,
                 )
                 operation_schema["uuid"] = user_uuid
                 response.dynamic_json = operation_schema
@@ -106,63 +126,143 @@ class BlueViAgent:
                 dynamic_json=None,
             )
         except Exception as error:
-            logging.error(f"Error in handle_operation_instruction: {error}")
+            logger.error("Error in handle_operation_instruction: %s", error)
             return GptResponseSchema(
                 status=HTTPStatus.OK.value,
                 response=BlueViResponseHandling.HANDLE_OPERATION_ERROR.value,
                 dynamic_json=None,
             )
 
-    def handle_general_instruction(
+    async def handle_general_instruction(
         self, conversation_history: List[Tuple[str, str]]
     ) -> GptResponseSchema:
         """Handle general conversation instructions."""
         try:
-            return self.model.assistant.generate_user_response_with_custom_instruction(
+            return await self.model.assistant.generate_user_response_with_custom_instruction(
                 conversation_history=conversation_history
             )
         except Exception as error:
-            logging.error(f"Error in handle_general_instruction: {error}")
+            logger.error("Error in handle_general_instruction: %s", error)
             return GptResponseSchema(
                 status=HTTPStatus.INTERNAL_SERVER_ERROR.value,
                 content=f"An error occurred while processing the conversation: {error}",
                 dynamic_json=None,
             )
 
+    async def identify_instruction(
+        self, conversation_history: List[Tuple[str, str]], message: Message
+    ) -> DecisionInstruction:
+        """Classify the conversation and flag the message if it holds personal data."""
+        decision_instruction_object = (
+            await self.model.assistant.identify_instruction_type(
+                conversation_history
+            )
+        )
+        logger.info("Decision instruction: %r", decision_instruction_object)
+        if decision_instruction_object.personal_data:
+            # The flag is not needed to answer, so write it off the hot path
+            task = asyncio.create_task(
+                self.db_manager.flag_message_async(message.id)
+            )
+            _background_tasks.add(task)
+            task.add_done_callback(_on_background_task_done)
+        return decision_instruction_object
+
+    async def identify_instruction_with_operation(
+        self, conversation_history: List[Tuple[str, str]], message: Message
+    ) -> Tuple[DecisionInstruction, Optional[BaseModel]]:
+        """Classify the conversation while extracting a possible operation concurrently."""
+        decision_instruction_object, operation_schema = await asyncio.gather(
+            self.identify_instruction(conversation_history, message),
+            self._speculate_operation(conversation_history),
+        )
+        if (
+            decision_instruction_object.instruction.value
+            != InstructionList.PHX_OPERATION.value
+        ):
+            # Not an operation, the speculative result is not needed
+            operation_schema = None
+        return decision_instruction_object, operation_schema
+
+    async def _speculate_operation(
+        self, conversation_history: List[Tuple[str, str]]
+    ) -> Optional[BaseModel]:
+        """Extract the operation ahead of classification, None on failure."""
+        try:
+            return await self.model.assistant.handle_phx_operation(
+                conversation_history
+            )
+        except Exception as error:
+            logger.error(
+                "Error in speculative operation extraction: %s", error
+            )
+            return None
+
     async def handle_conversation(
         self, user_uuid: str, message: Message
     ) -> GptResponseSchema:
         """Main entry point for handling a conversation."""
         try:
             conversation_history = await self.get_conversation_history(message)
-            logging.info('conversation_history in handle_conversation')
-            logging.info(conversation_history)
-            decision_instruction_object = (
-                self.model.assistant.identify_instruction_type(
-                    conversation_history
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Conversation history in handle_conversation: %r",
+                    conversation_history,
+                )
+            decision_instruction_object, operation_schema = (
+                await self.identify_instruction_with_operation(
+                    conversation_history, message
                 )
             )
-            logging.info('decision_instruction_object')
-            logging.info(decision_instruction_object)
-            if decision_instruction_object.personal_data:
-                self.db_manager.flag_message(message.id)
             if (
                 decision_instruction_object.instruction.value
                 == InstructionList.PHX_OPERATION.value
             ):
-                return self.handle_operation_instruction(
+                return await self.handle_operation_instruction(
                     conversation_history,
                     user_uuid,
                     decision_instruction_object.crud.value,
+                    operation_schema,
                 )
             else:
-                return self.handle_general_instruction(conversation_history)
+                return await self.handle_general_instruction(
+                    conversation_history
+                )
         except Exception as e:
-            logging.error(
-                f"Unexpected error while generating chat response in agent: {e}"
+            logger.error(
+                "Unexpected error while generating chat response in agent: %s",
+                e,
             )
             return GptResponseSchema(
                 status=HTTPStatus.INTERNAL_SERVER_ERROR.value,
                 content=f"An error occurred while processing the conversation: {e}",
                 dynamic_json=None,
             )
+
+    async def stream_conversation(
+        self, user_uuid: str, message: Message
+    ) -> AsyncIterator[GptResponseSchema]:
+        """Stream the response in chunks; operations arrive as a single chunk."""
+        conversation_history = await self.get_conversation_history(message)
+        decision_instruction_object, operation_schema = (
+            await self.identify_instruction_with_operation(
+                conversation_history, message
+            )
+        )
+        if (
+            decision_instruction_object.instruction.value
+            == InstructionList.PHX_OPERATION.value
+        ):
+            yield await self.handle_operation_instruction(
+                conversation_history,
+                user_uuid,
+                decision_instruction_object.crud.value,
+                operation_schema,
+            )
+            return
+
+        chunks = self.model.assistant.stream_user_response(
+            conversation_history
+        )
+        async for chunk in coalesce_chunks(chunks):
+            yield GptResponseSchema(status=HTTPStatus.OK.value, content=chunk)
@@ -1,6 +1,7 @@
 import logging
-from typing import List, Optional, Tuple, Type
+from typing import AsyncIterator, List, Optional, Tuple, Type
 from pydantic import BaseModel
+from app.config import PROMPT_CACHE_SIZE
 from app.model import Message
 from app.schemas import GptResponseSchema, PhxAppOperation, DecisionInstruction
 from app.types.enum.gpt import Role
@@ -11,9 +12,21 @@ from app.types.enum.instruction.blue_vi_gpt_instruction import (
 )
 from app.utils import (
     convert_blue_vi_response_to_schema,
+    get_response_format,
+    PromptCache,
     TokenUtils,
 )
 
+# Shared by every assistant so identical prompts hit across requests
+_prompt_cache = PromptCache(maxsize=PROMPT_CACHE_SIZE)
+
+# The only strings allowed as the system prompt, see _build_messages
+_STATIC_SYSTEM_PROMPTS = frozenset(
+    instruction.value for instruction in BlueViInstructionEnum
+)
+
+logger = logging.getLogger(__name__)
+
 
 class BlueViGptAssistant:
     def __init__(self, llm):
@@ -21,20 +34,15 @@ class BlueViGptAssistant:
         self.llm = llm
         self.token_utils = TokenUtils(self.llm)
 
-    def generate_user_response_with_custom_instruction(
+    async def generate_user_response_with_custom_instruction(
         self,
         conversation_history: List[Tuple[str, str]],
         instruction: Optional[str] = None,
     ) -> GptResponseSchema:
         """Generate a response from the model based on conversation history for the user role, optionally with a custom instruction."""
         try:
-            system_instruction = (
-                instruction
-                if instruction
-                else BlueViInstructionEnum.BLUE_VI_SYSTEM_DEFAULT_INSTRUCTION.value
-            )
-            if isinstance(system_instruction, Message):
-                system_instruction = system_instruction.content
+            if isinstance(instruction, Message):
+                instruction = instruction.content
             if isinstance(conversation_history, dict):
                 role = Role.USER.value
                 content_list = conversation_history['content']
@@ -42,121 +50,180 @@ class BlueViGptAssistant:
                     (role, str(content)) for content in content_list
                 ]
             # Generate the response using the common method
-            return self._create_response(
-                conversation_history, system_instruction
+            return await self._create_response(
+                conversation_history,
+                BlueViInstructionEnum.BLUE_VI_SYSTEM_DEFAULT_INSTRUCTION.value,
+                context=instruction,
             )
 
         except Exception as e:
-            logging.error(
-                f"Unexpected error while generating chat response in assistant: {e}"
+            logger.error(
+                "Unexpected error while generating chat response in assistant: %s",
+                e,
             )
             return GptResponseSchema(
                 status=HTTPStatus.INTERNAL_SERVER_ERROR.value,
                 content="Sorry, something went wrong while generating a response.",
             )
 
-    def get_anonymized_message(self, user_message: str) -> GptResponseSchema:
+    async def stream_user_response(
+        self,
+        conversation_history: List[Tuple[str, str]],
+        instruction: Optional[str] = None,
+    ) -> AsyncIterator[str]:
+        """Stream the response text for the user role as it is generated."""
+        messages = self._build_messages(
+            conversation_history,
+            BlueViInstructionEnum.BLUE_VI_SYSTEM_DEFAULT_INSTRUCTION.value,
+            context=instruction,
+        )
+        cache_key = _prompt_cache.key_for(messages)
+        cached_content = _prompt_cache.get(cache_key)
+        if cached_content is not None:
+            yield cached_content
+            return
+
+        client = self.llm["client"]
+        stream = await client.chat.completions.create(
+            model=self.llm["model"],
+            messages=messages,
+            stream=True,
+        )
+        parts = []
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+                yield chunk.choices[0].delta.content
+        # Only cache once the stream has completed
+        if parts:
+            _prompt_cache.set(cache_key, "".join(parts))
+
+    async def get_anonymized_message(
+        self, user_message: str
+    ) -> GptResponseSchema:
         """Anonymize the user message."""
         try:
-            return self._create_response(
-                [Role.USER.value, user_message],
+            return await self._create_response(
+                [(Role.USER.value, user_message)],
                 BlueViInstructionEnum.BLUE_VI_SYSTEM_ANONYMIZE_DATA.value,
             )
 
         except Exception as e:
-            logging.error(f"Error anonymizing message: {e}")
+            logger.error("Error anonymizing message: %s", e)
             return GptResponseSchema(
                 status=HTTPStatus.INTERNAL_SERVER_ERROR.value,
                 content="Unable to anonymize the message.",
             )
 
-    def identify_instruction_type(
+    async def identify_instruction_type(
         self, conversation_history: List[Tuple[str, str]]
     ) -> BaseModel:
         """Identify the type of instruction from the conversation history."""
-        return self._structured_model_response(
+        return await self._structured_model_response(
             conversation_history,
             BlueViInstructionEnum.BLUE_VI_SYSTEM_HANDLE_INSTRUCTION_DECISION.value,
             DecisionInstruction,
         )
 
-    def handle_phx_operation(
-        self, conversation_history: List[Tuple[str, str]], crud: CRUD
+    async def handle_phx_operation(
+        self,
+        conversation_history: List[Tuple[str, str]],
+        crud: Optional[CRUD] = None,
     ) -> BaseModel:
-        logging.info('crud in handle_phx_operation')
-        logging.info(crud)
         """Generate an operation schema based on the user's conversation history and model response."""
-        result = self._structured_model_response(
+        logger.info("CRUD in handle_phx_operation: %r", crud)
+        result = await self._structured_model_response(
             conversation_history,
             BlueViInstructionEnum.BLUE_VI_SYSTEM_HANDLE_OPERATION_PROCESS.value,
             PhxAppOperation,
         )
         return result
 
-    def _create_response(
-        self, conversation_history: List[Tuple[str, str]], instruction: str
+    async def _create_response(
+        self,
+        conversation_history: List[Tuple[str, str]],
+        instruction: str,
+        context: Optional[str] = None,
     ) -> GptResponseSchema:
         """Generate a response from the model and return a GptResponseSchema."""
         try:
-            messages = [
-                {"role": Role.SYSTEM.value, "content": instruction}
-            ] + [
-                {
-                    "role": (
-                        Role.USER.value
-                        if sender == Role.USER.value
-                        else Role.ASSISTANT.value
-                    ),
-                    "content": content,
-                }
-                for sender, content in conversation_history
-            ]
-
-            # Request the model's response
-            client = self.llm["client"]
-            response = client.chat.completions.create(
-                model=self.llm["model"],
-                messages=messages,
-            )
-
-            # Validate and extract response
-            choice = next(
-                (
-                    c
-                    for c in response.choices
-                    if hasattr(c, 'message') and c.message
-                ),
-                None,
-            )
-            if choice and choice.message.content:
-                return convert_blue_vi_response_to_schema(
-                    choice.message.content
-                )
-
-            # Handle missing or invalid response
-            error_msg = (
-                "Error: Invalid choice structure or empty response text."
-            )
-            logging.error(error_msg)
-            return GptResponseSchema(
-                status=HTTPStatus.INTERNAL_SERVER_ERROR.value,
-                content=error_msg,
+            messages = self._build_messages(
+                conversation_history, instruction, context
             )
+            cache_key = _prompt_cache.key_for(messages)
+            content = _prompt_cache.get(cache_key)
+            if content is None:
+                content = await self._complete(messages)
+                if content is None:
+                    error_msg = "Error: Invalid choice structure or empty response text."
+                    logger.error(error_msg)
+                    return GptResponseSchema(
+                        status=HTTPStatus.INTERNAL_SERVER_ERROR.value,
+                        content=error_msg,
+                    )
+                _prompt_cache.set(cache_key, content)
+            return convert_blue_vi_response_to_schema(content)
 
         except Exception as e:
-            logging.error(f"Error generating response: {e}")
+            logger.error("Error generating response: %s", e)
             return GptResponseSchema(
                 status=HTTPStatus.INTERNAL_SERVER_ERROR.value,
                 content="Error occurred while generating response.",
             )
 
-    def _structured_model_response(
+    async def _structured_model_response(
         self,
         conversation_history: List[Tuple[str, str]],
         instruction: str,
         response_format: Type[BaseModel],
     ) -> BaseModel:
         """Helper method to generate a response from the model and return a dynamically structured response."""
+        messages = self._build_messages(conversation_history, instruction)
+        content = await self._complete(
+            messages, response_format=get_response_format(response_format)
+        )
+        if content is None:
+            raise ValueError(
+                f"Empty structured response for {response_format.__name__}"
+            )
+        return response_format.model_validate_json(content)
+
+    async def _complete(self, messages: List[dict], **kwargs) -> Optional[str]:
+        """Request a completion for the messages and return its text, or None if there is none."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Messages in _complete: %r", messages)
+        client = self.llm["client"]
+        response = await client.chat.completions.create(
+            model=self.llm["model"], messages=messages, **kwargs
+        )
+        choices = response.choices or []
+        choice = next(
+            (c for c in choices if getattr(c, 'message', None)),
+            None,
+        )
+        if choice and choice.message.content:
+            return choice.message.content
+        return None
+
+    @staticmethod
+    def _build_messages(
+        conversation_history: List[Tuple[str, str]],
+        instruction: str,
+        context: Optional[str] = None,
+    ) -> List[dict]:
+        """
+        Build the chat messages sent to the model.
+
+        The endpoint reuses its KV cache for a matching prompt prefix, so the
+        system instruction must be one of the static instructions and always
+        comes first, and each turn is rendered the same way every time. Any
+        per-request text (operation details, retrieved data) goes in the
+        context message after the earlier turns, just before the latest user
+        turn, so it never invalidates the cached prefix.
+        """
+        assert (
+            instruction in _STATIC_SYSTEM_PROMPTS
+        ), "The system prompt must be a static BlueViInstructionEnum value"
         messages = [{"role": Role.SYSTEM.value, "content": instruction}] + [
             {
                 "role": (
@@ -168,14 +235,14 @@ class BlueViGptAssistant:
             }
             for sender, content in conversation_history
         ]
-        logging.info('messages in _structured_model_response')
-        logging.info(messages)
-        client = self.llm["client"]
-        response = client.beta.chat.completions.parse(
-            model=self.llm["model"],
-            messages=messages,
-            response_format=response_format,
-        )
-
-        structured_result = response.choices[0].message.parsed
-        return structured_result
+        if context:
+            position = (
+                len(messages) - 1
+                if len(messages) > 1
+                and messages[-1]["role"] == Role.USER.value
+                else len(messages)
+            )
+            messages.insert(
+                position, {"role": Role.SYSTEM.value, "content": context}
+            )
+        return messages
@@ -1,8 +1,11 @@
 import logging
-from openai import OpenAI
+from openai import AsyncOpenAI
 from app.config import GPT_ENDPOINT_URL
 from app.config.config_env import HF_TOKEN, LLM_MAX_TOKEN
 from app.llm.blue_vi_assistant import BlueViGptAssistant
+from app.types.enum.gpt import Role
+
+logger = logging.getLogger(__name__)
 
 
 class BlueViGptModel:
@@ -11,19 +14,19 @@ class BlueViGptModel:
         try:
             self.llm = self.load_model()
             self.assistant = BlueViGptAssistant(self.llm)
-            logging.info("BlueViGptModel initialized successfully.")
+            logger.info("BlueViGptModel initialized successfully.")
         except Exception as e:
-            logging.error(f"Failed to initialize BlueViGptModel: {e}")
+            logger.error("Failed to initialize BlueViGptModel: %s", e)
             raise
 
     @staticmethod
     def load_model():
         try:
-            logging.info(
+            logger.info(
                 "Connecting to Hugging Face endpoint using OpenAI client."
             )
-            client = OpenAI(base_url=GPT_ENDPOINT_URL, api_key=HF_TOKEN)
-            logging.info(
+            client = AsyncOpenAI(base_url=GPT_ENDPOINT_URL, api_key=HF_TOKEN)
+            logger.info(
                 "OpenAI client connected successfully. Configuring model settings."
             )
 
@@ -35,18 +38,31 @@ class BlueViGptModel:
                 "response_format": "json",
             }
         except Exception as e:
-            logging.error(
-                f"Error connecting to Hugging Face using OpenAI client: {e}"
+            logger.error(
+                "Error connecting to Hugging Face using OpenAI client: %s", e
             )
             raise RuntimeError(
                 "Failed to connect to the Hugging Face endpoint."
             ) from e
 
-    @staticmethod
-    def close():
+    async def warm_up(self):
+        """Send a one-token request so the first user request is not slowed by model loading."""
+        try:
+            # Do not hold up startup for long when the endpoint is not ready
+            client = self.llm["client"].with_options(timeout=30, max_retries=0)
+            await client.chat.completions.create(
+                model=self.llm["model"],
+                messages=[{"role": Role.USER.value, "content": "warmup"}],
+                max_tokens=1,
+            )
+            logger.info("Model warm-up completed.")
+        except Exception as e:
+            logger.error("Model warm-up failed: %s", e)
+
+    async def close(self):
         """Close and clean up resources."""
         try:
-            logging.info("Closing OpenAI client resources.")
-            # No specific close method for OpenAI client, but placeholder for any resource cleanup.
+            logger.info("Closing OpenAI client resources.")
+            await self.llm["client"].close()
         except Exception as e:
-            logging.error(f"Error during OpenAI client resource cleanup: {e}")
+            logger.error("Error during OpenAI client resource cleanup: %s", e)
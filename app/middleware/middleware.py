@@ -1,6 +1,7 @@
 from fastapi import Request, HTTPException
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse, Response
+from fastapi.responses import ORJSONResponse
+from starlette.responses import Response
 import logging
 from app.types.enum.http_status import HTTPStatus
 from app.auth.auth import Auth
@@ -14,7 +15,7 @@ class CustomMiddleware(BaseHTTPMiddleware):
         try:
             Auth.is_token_valid(request)
         except HTTPException as e:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"detail": e.detail},
                 status_code=e.status_code,
             )
@@ -22,7 +23,7 @@ class CustomMiddleware(BaseHTTPMiddleware):
             logging.error(
                 f"Unexpected error occurred: {str(e)} at {request.url.path}"
             )
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"detail": "Internal Server Error"},
                 status_code=HTTPStatus.INTERNAL_SERVER_ERROR.value,
             )
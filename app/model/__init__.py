@@ -1 +1,7 @@
-from .models import Conversation, Message, User, UserConversation
+from .models import (
+    Conversation,
+    Message,
+    MessageVector,
+    User,
+    UserConversation,
+)
@@ -7,10 +7,12 @@ from sqlalchemy import (
     Text,
     Boolean,
     String,
+    Index,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.database import Base
+from app.database.vector_type import Float32Vector
 
 
 class User(Base):
@@ -83,3 +85,22 @@ class Message(Base):
     )
 
     sensitive_data_flag = Column(Boolean, nullable=False, default=False)
+
+    # Serves "latest N messages of a conversation" as an index range scan
+    __table_args__ = (
+        Index(
+            'ix_messages_conv_time',
+            user_conversation_id,
+            created_at.desc(),
+        ),
+    )
+
+
+class MessageVector(Base):
+    __tablename__ = 'message_vectors'
+
+    message_id = Column(Integer, ForeignKey('messages.id'), primary_key=True)
+    conversation_id = Column(
+        Integer, ForeignKey('conversations.id'), nullable=False, index=True
+    )
+    embedding_vector = Column(Float32Vector, nullable=False)
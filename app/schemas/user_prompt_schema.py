@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 
@@ -7,3 +7,9 @@ class UserPromptSchema(BaseModel):
     user_name: str
     prompt: Optional[str] = None
     conversation_order: Optional[int] = None
+
+
+class ChatPromptSchema(UserPromptSchema):
+    prompt: str = Field(min_length=1, max_length=16384)
+
+    model_config = ConfigDict(str_strip_whitespace=True)
@@ -1,9 +1,10 @@
 import time
+from typing import AsyncIterator
 
 from app.database.database_manager import DatabaseManager
 from app.services.cache import CacheService
 
-from app.schemas import UserPromptSchema
+from app.schemas import GptResponseSchema, UserPromptSchema
 from app.client import RedisClient
 from app.llm import BlueViAgent
 from fastapi import Request
@@ -11,7 +12,7 @@ import logging
 
 from app.types.enum.gpt import MessageType, Role
 from app.types.enum.http_status import HTTPStatus
-from app.utils import ResponseUtils
+from app.utils import ResponseUtils, format_sse
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -19,8 +20,14 @@ logger = logging.getLogger(__name__)
 
 
 class ChatService:
-    def __init__(self, db, user_prompt: UserPromptSchema, request: Request):
-        self.db_manager = DatabaseManager(db)
+    def __init__(
+        self,
+        db,
+        user_prompt: UserPromptSchema,
+        request: Request,
+        async_db=None,
+    ):
+        self.db_manager = DatabaseManager(db, async_db)
         self.cache_service = CacheService(RedisClient())
         self.response_utils = ResponseUtils()
         self.user = user_prompt
@@ -32,7 +39,6 @@ class ChatService:
 
     async def handle_chat(self) -> dict:
         try:
-            logging.info('why')
             start_time = time.time()
             user = await self._get_or_create_user()
             conversation = await self._get_or_create_conversation(user.id)
@@ -87,11 +93,88 @@ class ChatService:
                 bot_response, conversation.conversation_order
             )
         except Exception as e:
-            logger.error(f"Error in handle_chat: {str(e)}", exc_info=True)
+            logger.error("Error in handle_chat: %s", e, exc_info=True)
             return self.response_utils.error_response(
                 HTTPStatus.INTERNAL_SERVER_ERROR, "Request processing error."
             )
 
+    async def handle_chat_stream(self) -> AsyncIterator[str]:
+        """Handle the chat and stream the bot response as server-sent events."""
+        try:
+            start_time = time.time()
+            user = await self._get_or_create_user()
+            conversation = await self._get_or_create_conversation(user.id)
+            user_conversation = await self._get_or_create_user_conversation(
+                user.id, conversation.id
+            )
+
+            user_message = self.db_manager.create_message(
+                user_conversation.id,
+                self.user.prompt,
+                MessageType.PROMPT,
+                Role.USER,
+            )
+            if not user_message:
+                yield format_sse(
+                    self.response_utils.error_response(
+                        HTTPStatus.INTERNAL_SERVER_ERROR,
+                        "Failed to store user message.",
+                    ),
+                    event="error",
+                )
+                return
+            await self.cache_service.cache_message(
+                user_conversation.id, user_message
+            )
+
+            # Forward each chunk as soon as it is generated
+            bot_response = GptResponseSchema(
+                status=HTTPStatus.OK.value, content=""
+            )
+            async for chunk in self.agent.stream_conversation(
+                user.uuid, user_message
+            ):
+                bot_response.status = chunk.status
+                bot_response.content += chunk.content
+                bot_response.dynamic_json = chunk.dynamic_json
+                bot_response.operationType = chunk.operationType
+                yield format_sse(
+                    {
+                        "status": chunk.status,
+                        "response": chunk.content,
+                        "dynamic_json": chunk.dynamic_json,
+                        "operationType": chunk.operationType,
+                    }
+                )
+
+            # Store and cache the complete bot response
+            self.db_manager.create_message(
+                user_conversation.id,
+                bot_response.content,
+                MessageType.RESPONSE,
+                Role.ASSISTANT,
+            )
+            await self.cache_service.cache_message(
+                user_conversation.id, bot_response
+            )
+            yield format_sse(
+                {
+                    "status": bot_response.status,
+                    "conversation_order": conversation.conversation_order,
+                    "time_taken": time.time() - start_time,
+                },
+                event="done",
+            )
+        except Exception as e:
+            logger.error("Error in handle_chat_stream: %s", e, exc_info=True)
+            yield format_sse(
+                self.response_utils.error_response(
+                    HTTPStatus.INTERNAL_SERVER_ERROR,
+                    "Request processing error.",
+                ),
+                event="error",
+            )
+
     async def _get_or_create_user(self):
         """Handles user retrieval or creation."""
         cached_user = await self.cache_service.get_user(self.user.uuid)
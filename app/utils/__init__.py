@@ -7,3 +7,6 @@ from .response_utils import ResponseUtils
 from .convert_blue_vi_response_to_schema import (
     convert_blue_vi_response_to_schema,
 )
+from .sse import format_sse, coalesce_chunks
+from .prompt_cache import PromptCache
+from .response_format import get_response_format
@@ -1,21 +1,27 @@
 import logging
+from operator import attrgetter
 from typing import List
 from app.model import Message
 from app.types.enum.gpt import Role
 
+logger = logging.getLogger(__name__)
+
 
 def convert_conversation_history_to_tuples(
     conversation_history: List[Message],
 ) -> List[tuple[str, str]]:
     """Converts the conversation history to a list of tuples (role, content), ensuring correct order."""
     # Ensure conversation is ordered by timestamp, assuming created_at exists
-    sorted_history = sorted(
-        conversation_history, key=lambda msg: msg.created_at
-    )
-    for message in sorted_history:
-        logging.info(
-            f"Message ID: {message.id}, Created At: {message.created_at}, Role: {message.role}, Content: {message.content}"
-        )
+    sorted_history = sorted(conversation_history, key=attrgetter("created_at"))
+    if logger.isEnabledFor(logging.DEBUG):
+        for message in sorted_history:
+            logger.debug(
+                "Message ID: %s, Created At: %s, Role: %s, Content: %r",
+                message.id,
+                message.created_at,
+                message.role,
+                message.content,
+            )
 
     return [
         (Role.USER if message.id else Role.ASSISTANT, message.content)
@@ -0,0 +1,52 @@
+import hashlib
+import json
+import logging
+from typing import List, Optional
+
+from cachetools import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class PromptCache:
+    """LRU cache of model completions keyed on the exact prompt messages."""
+
+    def __init__(self, maxsize: int = 1024):
+        self._cache = LRUCache(maxsize=maxsize)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(messages: List[dict]) -> bytes:
+        """Hash the canonical JSON form of the messages."""
+        canonical = json.dumps(
+            messages,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        ).encode("utf-8")
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Return the cached completion for the key, if any."""
+        content = self._cache.get(key)
+        if content is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Prompt cache %s | Hit ratio: %.2f%%",
+                "hit" if content is not None else "miss",
+                self.hit_ratio * 100,
+            )
+        return content
+
+    def set(self, key: bytes, content: str) -> None:
+        """Store a completion for the key."""
+        self._cache[key] = content
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
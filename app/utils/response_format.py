@@ -0,0 +1,21 @@
+from functools import lru_cache
+from typing import Any, Dict, Type
+
+from pydantic import BaseModel
+
+
+@lru_cache(maxsize=None)
+def get_response_format(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Build the JSON schema response format for a structured model response.
+
+    Schema generation walks the whole model, so it is done once per model
+    and the result is reused; callers must not mutate the returned dict.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "schema": model.model_json_schema(),
+        },
+    }
@@ -0,0 +1,48 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+_STREAM_END = object()
+
+
+def format_sse(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    """Format a payload as a single server-sent event frame."""
+    # Operation payloads hold enums and pydantic models
+    frame = f"data: {json.dumps(jsonable_encoder(data))}\n\n"
+    return f"event: {event}\n{frame}" if event else frame
+
+
+async def coalesce_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Merge text chunks that are already waiting into one chunk.
+
+    Chunks that arrive while the consumer is busy are joined and yielded
+    together, so a burst of tokens costs one frame instead of many.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce():
+        try:
+            async for chunk in chunks:
+                queue.put_nowait(chunk)
+        finally:
+            queue.put_nowait(_STREAM_END)
+
+    producer = asyncio.create_task(produce())
+    try:
+        done = False
+        while not done:
+            parts = [await queue.get()]
+            while not queue.empty():
+                parts.append(queue.get_nowait())
+            if parts[-1] is _STREAM_END:
+                parts.pop()
+                done = True
+            if parts:
+                yield "".join(parts)
+        # Re-raise any error from the underlying stream
+        await producer
+    finally:
+        producer.cancel()
@@ -1,7 +1,11 @@
 import logging
-from collections import deque
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Optional, Tuple
 
-from transformers import AutoTokenizer
+from transformers import AutoTokenizer, PreTrainedTokenizerBase
 
 from app.config.config_env import (
     LLM_MAX_TOKEN,
@@ -9,53 +13,108 @@ from app.config.config_env import (
     MODEL_NAME,
 )
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _load_tokenizer(model_name: str) -> Optional[PreTrainedTokenizerBase]:
+    """Load the tokenizer once per process, or None if it is unavailable."""
+    try:
+        return AutoTokenizer.from_pretrained(model_name)
+    except Exception as e:
+        logger.error("Failed to load tokenizer for %s: %s", model_name, e)
+        return None
+
+
+_TOKEN_COUNT_CACHE_SIZE = 4096
+_token_count_cache: "OrderedDict[Tuple[Optional[str], str], int]" = (
+    OrderedDict()
+)
+
+
+def _count_tokens_batch(
+    model_name: Optional[str], texts: List[str]
+) -> List[int]:
+    """Count tokens for many texts with a single tokenizer call."""
+    missing = [
+        text
+        for text in dict.fromkeys(texts)
+        if (model_name, text) not in _token_count_cache
+    ]
+    if missing:
+        tokenizer = _load_tokenizer(model_name) if model_name else None
+        if tokenizer is None:
+            # Rough BPE estimate when the tokenizer is unavailable
+            counts = [len(text) // 4 for text in missing]
+        else:
+            counts = [
+                len(ids)
+                for ids in tokenizer(missing, add_special_tokens=False)[
+                    "input_ids"
+                ]
+            ]
+        for text, count in zip(missing, counts):
+            _token_count_cache[(model_name, text)] = count
+
+    result = []
+    for text in texts:
+        _token_count_cache.move_to_end((model_name, text))
+        result.append(_token_count_cache[(model_name, text)])
+    while len(_token_count_cache) > _TOKEN_COUNT_CACHE_SIZE:
+        _token_count_cache.popitem(last=False)
+    return result
+
 
 class TokenUtils:
     def __init__(self, model):
         self.model = model
-        self.tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+        self.tokenizer = _load_tokenizer(MODEL_NAME) if MODEL_NAME else None
         self.max_tokens = LLM_MAX_TOKEN - 50
         self.history_window_size = MAX_HISTORY_WINDOW_SIZE - 50
 
     def trim_history_to_fit_tokens(self, conversation_history: list) -> list:
         """Trim the conversation history based on max tokens and window size."""
         # Limit history to the maximum window size
-        conversation_history = deque(
-            conversation_history[-self.history_window_size :]
-        )
+        conversation_history = conversation_history[
+            -self.history_window_size :
+        ]
 
-        total_tokens = sum(
-            self.count_tokens(message.content)
-            for message in conversation_history
+        token_counts = self.count_tokens_batch(
+            [self._content_of(message) for message in conversation_history]
         )
-        logging.debug(
-            f"Initial total tokens: {total_tokens} | Max tokens: {self.max_tokens}"
+        # prefix_sums[i] is the number of tokens in the first i messages, so
+        # the first message to keep is the first i that leaves a fitting tail
+        prefix_sums = list(accumulate(token_counts, initial=0))
+        total_tokens = prefix_sums[-1]
+        start = bisect_left(prefix_sums, total_tokens - self.max_tokens)
+        logger.debug(
+            "Total tokens: %d | Max tokens: %d | Dropped messages: %d",
+            total_tokens,
+            self.max_tokens,
+            start,
         )
+        return conversation_history[start:]
 
-        while total_tokens > self.max_tokens and conversation_history:
-            removed_message = conversation_history.popleft()
-            removed_tokens = self.count_tokens(removed_message.content)
-            total_tokens -= removed_tokens
-            logging.debug(
-                f"Removed: {removed_message.content[:50]}... | Removed tokens: {removed_tokens} | Remaining total: {total_tokens}"
-            )
+    def count_tokens(self, text: str) -> int:
+        """Count the number of tokens in a given text."""
+        return self.count_tokens_batch([text])[0]
 
-        return list(conversation_history)
-
-    def count_tokens(
-        self, text: str, add_bos: bool = True, special: bool = False
-    ) -> int:
-        """Estimate the number of tokens in a given text."""
-        if isinstance(text, str):
-            text = text.encode('utf-8')
-        try:
-            tokens = self.tokenizer.tokenize(
-                text, add_bos=add_bos, special=special
-            )
-            logging.info(
-                f"Text: {text[:50]}... | Tokens: {tokens} | Count: {len(tokens)}"
+    @staticmethod
+    def count_tokens_batch(texts: List[str]) -> List[int]:
+        """Count the number of tokens in each text using one tokenizer call."""
+        texts = [
+            (
+                text.decode('utf-8', errors='ignore')
+                if isinstance(text, bytes)
+                else text or ""
             )
-            return len(tokens)
-        except RuntimeError as e:
-            logging.error(f"Tokenization failed for text: {text[:50]}...: {e}")
-            return 0
+            for text in texts
+        ]
+        return _count_tokens_batch(MODEL_NAME, texts)
+
+    @staticmethod
+    def _content_of(message) -> str:
+        """Return the text of a (role, content) tuple or a Message."""
+        if isinstance(message, tuple):
+            return message[1]
+        return message.content
@@ -0,0 +1,18 @@
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import ChatPromptSchema
+
+
+def test_chat_prompt_schema_strips_prompt():
+    user_prompt = ChatPromptSchema(
+        uuid="uuid", user_name="Alice", prompt="  Hello  "
+    )
+
+    assert user_prompt.prompt == "Hello"
+
+
+@pytest.mark.parametrize("prompt", [None, "", "   ", "a" * 16385])
+def test_chat_prompt_schema_rejects_invalid_prompt(prompt):
+    with pytest.raises(ValidationError):
+        ChatPromptSchema(uuid="uuid", user_name="Alice", prompt=prompt)
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import create_autospec
+from unittest.mock import AsyncMock, MagicMock, create_autospec, patch
 from sqlalchemy.orm import Session
 
 from app.database import DatabaseManager
@@ -134,3 +134,44 @@ def test_check_user_conversation_exists(db_manager, mock_db_session):
     )
 
     assert exists is True
+
+
+@pytest.mark.asyncio
+async def test_get_messages_by_user_conversation_id_returns_latest_oldest_first(
+    mock_db_session,
+):
+    newest = Message(id=2, content="newest")
+    oldest = Message(id=1, content="oldest")
+    mock_async_session = AsyncMock()
+    mock_async_session.execute.return_value = MagicMock(
+        scalars=lambda: MagicMock(all=lambda: [newest, oldest])
+    )
+    db_manager = DatabaseManager(mock_db_session, mock_async_session)
+
+    messages = await db_manager.get_messages_by_user_conversation_id(
+        1, limit=2
+    )
+
+    assert messages == [oldest, newest]
+    mock_async_session.execute.assert_awaited_once()
+    mock_db_session.query.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_flag_message_async_uses_its_own_session(mock_db_session):
+    request_session = AsyncMock()
+    flag_session = AsyncMock()
+    db_manager = DatabaseManager(mock_db_session, request_session)
+
+    with patch(
+        "app.database.model_managers.message_manager.Database.get_async_engine"
+    ), patch(
+        "app.database.model_managers.message_manager.AsyncSession"
+    ) as mock_async_session:
+        mock_async_session.return_value.__aenter__.return_value = flag_session
+        await db_manager.flag_message_async(1)
+
+    flag_session.execute.assert_awaited_once()
+    flag_session.commit.assert_awaited_once()
+    request_session.execute.assert_not_called()
+    mock_db_session.query.assert_not_called()
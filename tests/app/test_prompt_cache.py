@@ -0,0 +1,31 @@
+from app.types.enum.gpt import Role
+from app.utils import PromptCache
+
+
+def test_prompt_cache_hits_only_on_identical_messages():
+    cache = PromptCache(maxsize=2)
+    messages = [{"role": Role.USER.value, "content": "Hello"}]
+    key = cache.key_for(messages)
+
+    assert cache.get(key) is None
+    cache.set(key, "Hi there")
+
+    assert cache.get(cache.key_for([dict(messages[0])])) == "Hi there"
+    assert (
+        cache.get(cache.key_for([{"role": Role.USER.value, "content": "Hi"}]))
+        is None
+    )
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_prompt_cache_evicts_least_recently_used():
+    cache = PromptCache(maxsize=1)
+    first = cache.key_for([{"role": Role.USER.value, "content": "one"}])
+    second = cache.key_for([{"role": Role.USER.value, "content": "two"}])
+
+    cache.set(first, "1")
+    cache.set(second, "2")
+
+    assert cache.get(first) is None
+    assert cache.get(second) == "2"
@@ -0,0 +1,15 @@
+import app.database  # noqa: F401
+from app.schemas import DecisionInstruction
+from app.utils import get_response_format
+
+
+def test_response_format_is_built_once_per_model():
+    first = get_response_format(DecisionInstruction)
+
+    assert first is get_response_format(DecisionInstruction)
+    assert first["type"] == "json_schema"
+    assert first["json_schema"]["name"] == "DecisionInstruction"
+    assert (
+        first["json_schema"]["schema"]
+        == DecisionInstruction.model_json_schema()
+    )
@@ -0,0 +1,75 @@
+import asyncio
+import json
+
+import pytest
+
+import app.database  # noqa: F401
+from app.schemas import PhxAppOperation, TMethodOfConsultData
+from app.types.enum.operation import MethodOfConsultEnum, VatRate
+from app.utils import coalesce_chunks, format_sse
+
+
+async def _collect(chunks):
+    return [chunk async for chunk in chunks]
+
+
+def test_format_sse_frames_operation_chunk():
+    operation = PhxAppOperation(
+        name="Consultation",
+        vatRate=VatRate.HIGH,
+        methodsOfConsult=[
+            TMethodOfConsultData(
+                shortCode=MethodOfConsultEnum.TEL, name="Phone"
+            )
+        ],
+    )
+
+    frame = format_sse(
+        {"status": 200, "response": "", "dynamic_json": vars(operation)},
+        event="chunk",
+    )
+
+    event, data = frame.split("\n", 1)
+    assert event == "event: chunk"
+    assert data.startswith("data: ") and data.endswith("\n\n")
+    payload = json.loads(data[len("data: ") :])
+    assert payload["dynamic_json"]["vatRate"] == VatRate.HIGH.value
+    assert payload["dynamic_json"]["methodsOfConsult"] == [
+        {"shortCode": "TEL", "name": "Phone"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chunks_merges_waiting_chunks():
+    async def burst():
+        for chunk in ["Hel", "lo", " there"]:
+            yield chunk
+
+    assert await _collect(coalesce_chunks(burst())) == ["Hello there"]
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chunks_keeps_order_across_slow_chunks():
+    async def slow():
+        for chunk in ["a", "b", "c"]:
+            await asyncio.sleep(0.01)
+            yield chunk
+
+    chunks = await _collect(coalesce_chunks(slow()))
+
+    assert "".join(chunks) == "abc"
+    assert len(chunks) == 3
+
+
+@pytest.mark.asyncio
+async def test_coalesce_chunks_propagates_stream_errors():
+    async def failing():
+        yield "partial"
+        raise RuntimeError("stream broke")
+
+    received = []
+    with pytest.raises(RuntimeError, match="stream broke"):
+        async for chunk in coalesce_chunks(failing()):
+            received.append(chunk)
+
+    assert received == ["partial"]
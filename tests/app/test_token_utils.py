@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.types.enum.gpt import Role
+from app.utils import TokenUtils
+
+
+@pytest.fixture
+def token_utils():
+    with patch("app.utils.token_utils.MODEL_NAME", None):
+        utils = TokenUtils(model=None)
+        yield utils
+
+
+def test_count_tokens_falls_back_to_character_estimate(token_utils):
+    assert token_utils.tokenizer is None
+    assert token_utils.count_tokens("a" * 40) == 10
+    assert token_utils.count_tokens(b"a" * 40) == 10
+    assert token_utils.count_tokens("") == 0
+
+
+def test_trim_history_keeps_everything_within_budget(token_utils):
+    token_utils.max_tokens = 100
+    history = [(Role.USER.value, "a" * 40), (Role.ASSISTANT.value, "b" * 40)]
+
+    assert token_utils.trim_history_to_fit_tokens(history) == history
+
+
+def test_trim_history_drops_oldest_messages_first(token_utils):
+    token_utils.max_tokens = 25
+    history = [
+        (Role.USER.value, "a" * 40),
+        (Role.ASSISTANT.value, "b" * 40),
+        (Role.USER.value, "c" * 40),
+    ]
+
+    assert token_utils.trim_history_to_fit_tokens(history) == history[1:]
+
+
+def test_trim_history_can_drop_all_messages(token_utils):
+    token_utils.max_tokens = 5
+    history = [(Role.USER.value, "a" * 40)]
+
+    assert token_utils.trim_history_to_fit_tokens(history) == []
+
+
+def test_count_tokens_batch_tokenizes_uncached_texts_in_one_call():
+    tokenizer = MagicMock(
+        side_effect=lambda texts, **kwargs: {
+            "input_ids": [[0] * len(text.split()) for text in texts]
+        }
+    )
+    with patch("app.utils.token_utils.MODEL_NAME", "batch-test-model"), patch(
+        "app.utils.token_utils._load_tokenizer", return_value=tokenizer
+    ):
+        token_utils = TokenUtils(model=None)
+        counts = token_utils.count_tokens_batch(
+            ["one two", "three", "one two"]
+        )
+        assert counts == [2, 1, 2]
+        tokenizer.assert_called_once_with(
+            ["one two", "three"], add_special_tokens=False
+        )
+
+        # Cached texts are not tokenized again
+        assert token_utils.count_tokens("three") == 1
+        tokenizer.assert_called_once()
@@ -0,0 +1,20 @@
+import pytest
+
+from app.database.vector_type import Float32Vector
+
+
+def test_float32_vector_round_trip():
+    vector_type = Float32Vector()
+    stored = vector_type.process_bind_param([0.5, -1.25, 2.0], dialect=None)
+
+    assert isinstance(stored, bytes)
+    assert len(stored) == 3 * 4
+    loaded = vector_type.process_result_value(stored, dialect=None)
+    assert list(loaded) == pytest.approx([0.5, -1.25, 2.0])
+
+
+def test_float32_vector_keeps_none():
+    vector_type = Float32Vector()
+
+    assert vector_type.process_bind_param(None, dialect=None) is None
+    assert vector_type.process_result_value(None, dialect=None) is None
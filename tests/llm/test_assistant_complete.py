@@ -0,0 +1,89 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+import app.database  # noqa: F401
+from app.llm.blue_vi_assistant import BlueViGptAssistant
+from app.schemas import DecisionInstruction
+from app.types.enum.gpt import Role
+from app.types.enum.instruction.blue_vi_gpt_instruction import (
+    BlueViInstructionEnum,
+)
+
+
+def _assistant(*contents):
+    choices = [
+        SimpleNamespace(message=SimpleNamespace(content=content))
+        for content in contents
+    ]
+    client = SimpleNamespace(
+        chat=SimpleNamespace(
+            completions=SimpleNamespace(
+                create=AsyncMock(return_value=SimpleNamespace(choices=choices))
+            )
+        )
+    )
+    return BlueViGptAssistant({"client": client, "model": "tgi"}), client
+
+
+@pytest.mark.asyncio
+async def test_complete_returns_none_without_choices():
+    assistant, _ = _assistant()
+
+    assert await assistant._complete([]) is None
+
+
+@pytest.mark.asyncio
+async def test_structured_response_is_validated_from_completion():
+    assistant, client = _assistant(
+        '{"instruction": "PHX_OPERATION", "crud": "READ"}'
+    )
+
+    result = await assistant.identify_instruction_type(
+        [(Role.USER.value, "Show my appointments for tomorrow")]
+    )
+
+    assert isinstance(result, DecisionInstruction)
+    assert result.crud.value == "READ"
+    kwargs = client.chat.completions.create.await_args.kwargs
+    assert kwargs["response_format"]["type"] == "json_schema"
+
+
+@pytest.mark.asyncio
+async def test_anonymized_message_is_sent_as_user_turn():
+    assistant, client = _assistant("[NAME_1] called.")
+
+    await assistant.get_anonymized_message("John Doe called.")
+
+    messages = client.chat.completions.create.await_args.kwargs["messages"]
+    assert messages[1:] == [
+        {"role": Role.USER.value, "content": "John Doe called."}
+    ]
+
+
+def test_context_is_placed_before_latest_user_turn():
+    history = [
+        (Role.USER.value, "Create an operation"),
+        (Role.ASSISTANT.value, "Which one?"),
+        (Role.USER.value, "A consultation"),
+    ]
+    instruction = (
+        BlueViInstructionEnum.BLUE_VI_SYSTEM_DEFAULT_INSTRUCTION.value
+    )
+
+    messages = BlueViGptAssistant._build_messages(
+        history, instruction, context="details: {}"
+    )
+
+    assert messages[0] == {"role": Role.SYSTEM.value, "content": instruction}
+    assert messages[-2] == {
+        "role": Role.SYSTEM.value,
+        "content": "details: {}",
+    }
+    assert messages[-1]["content"] == "A consultation"
+
+
+def test_dynamic_system_prompt_is_rejected():
+    with pytest.raises(AssertionError):
+        BlueViGptAssistant._build_messages([], "Hello Alice")
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import app.database  # noqa: F401
+from app.llm import blue_vi_agent
+from app.llm.blue_vi_agent import BlueViAgent
+from app.model import Message
+from app.schemas import (
+    DecisionInstruction,
+    GptResponseSchema,
+    PhxAppOperation,
+)
+from app.types.enum.gpt import Role
+from app.types.enum.http_status import HTTPStatus
+from app.types.enum.instruction import CRUD, InstructionList
+
+HISTORY = [(Role.USER.value, "Create a phone consultation operation")]
+
+
+@pytest.fixture
+def agent():
+    model = MagicMock()
+    model.assistant = AsyncMock()
+    db_manager = MagicMock()
+    db_manager.flag_message_async = AsyncMock()
+    return BlueViAgent(model, db_manager, MagicMock())
+
+
+async def _wait_for_background_tasks():
+    await asyncio.gather(
+        *blue_vi_agent._background_tasks, return_exceptions=True
+    )
+    # Let the done callbacks run
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_personal_data_flag_is_written_in_background(agent):
+    agent.model.assistant.identify_instruction_type.return_value = (
+        DecisionInstruction(personal_data=True)
+    )
+
+    await agent.identify_instruction(HISTORY, Message(id=7))
+
+    assert len(blue_vi_agent._background_tasks) == 1
+    await _wait_for_background_tasks()
+    agent.db_manager.flag_message_async.assert_awaited_once_with(7)
+    assert not blue_vi_agent._background_tasks
+
+
+@pytest.mark.asyncio
+async def test_failed_background_flag_is_logged(agent, caplog):
+    agent.model.assistant.identify_instruction_type.return_value = (
+        DecisionInstruction(personal_data=True)
+    )
+    agent.db_manager.flag_message_async.side_effect = RuntimeError("db down")
+
+    with caplog.at_level(logging.ERROR, logger=blue_vi_agent.__name__):
+        await agent.identify_instruction(HISTORY, Message(id=7))
+        await _wait_for_background_tasks()
+
+    assert "Background task failed: db down" in caplog.text
+    assert not blue_vi_agent._background_tasks
+
+
+@pytest.mark.asyncio
+async def test_message_without_personal_data_is_not_flagged(agent):
+    agent.model.assistant.identify_instruction_type.return_value = (
+        DecisionInstruction()
+    )
+
+    await agent.identify_instruction(HISTORY, Message(id=7))
+
+    assert not blue_vi_agent._background_tasks
+    agent.db_manager.flag_message_async.assert_not_called()
+
+
+def _prepare_conversation(agent, decision):
+    agent.get_conversation_history = AsyncMock(return_value=HISTORY)
+    agent.model.assistant.identify_instruction_type.return_value = decision
+    agent.model.assistant.generate_user_response_with_custom_instruction.return_value = GptResponseSchema(
+        status=HTTPStatus.OK.value, content="Done"
+    )
+
+
+@pytest.mark.asyncio
+async def test_speculative_operation_is_used_for_operation_turn(agent):
+    _prepare_conversation(
+        agent,
+        DecisionInstruction(
+            instruction=InstructionList.PHX_OPERATION, crud=CRUD.CREATE
+        ),
+    )
+    agent.model.assistant.handle_phx_operation.return_value = PhxAppOperation(
+        name="Consultation"
+    )
+
+    response = await agent.handle_conversation("user-uuid", Message(id=7))
+
+    agent.model.assistant.handle_phx_operation.assert_awaited_once_with(
+        HISTORY
+    )
+    assert response.dynamic_json["name"] == "Consultation"
+    assert response.dynamic_json["uuid"] == "user-uuid"
+    assert response.operationType == InstructionList.PHX_OPERATION.value
+
+
+@pytest.mark.asyncio
+async def test_speculative_operation_is_dropped_for_general_turn(agent):
+    _prepare_conversation(
+        agent,
+        DecisionInstruction(
+            instruction=InstructionList.DEFAULT, crud=CRUD.NONE
+        ),
+    )
+    agent.model.assistant.handle_phx_operation.return_value = PhxAppOperation(
+        name="Consultation"
+    )
+
+    decision, operation_schema = (
+        await agent.identify_instruction_with_operation(HISTORY, Message(id=7))
+    )
+    response = await agent.handle_conversation("user-uuid", Message(id=7))
+
+    assert decision.instruction == InstructionList.DEFAULT
+    assert operation_schema is None
+    assert response.dynamic_json is None
+    agent.model.assistant.generate_user_response_with_custom_instruction.assert_awaited_with(
+        conversation_history=HISTORY
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_speculation_falls_back_to_operation_extraction(agent):
+    _prepare_conversation(
+        agent,
+        DecisionInstruction(
+            instruction=InstructionList.PHX_OPERATION, crud=CRUD.CREATE
+        ),
+    )
+    agent.model.assistant.handle_phx_operation.side_effect = [
+        RuntimeError("endpoint timeout"),
+        PhxAppOperation(name="Consultation"),
+    ]
+
+    response = await agent.handle_conversation("user-uuid", Message(id=7))
+
+    assert agent.model.assistant.handle_phx_operation.await_count == 2
+    agent.model.assistant.handle_phx_operation.assert_awaited_with(
+        HISTORY, CRUD.CREATE.value
+    )
+    assert response.dynamic_json["name"] == "Consultation"
+    assert response.operationType == InstructionList.PHX_OPERATION.value
@@ -14,7 +14,7 @@ class TestGetResponse:
     async def test_get_response_with_real_model(self, blue_vi_gpt_model):
         user_message = "Hello, how are you?"
         messages = [Message(role=Role.USER, content=user_message)]
-        response = blue_vi_gpt_model.assistant.generate_user_response_with_custom_instruction(
+        response = await blue_vi_gpt_model.assistant.generate_user_response_with_custom_instruction(
             messages
         )
 
@@ -29,7 +29,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_name(self, blue_vi_gpt_model):
         user_message = "John Doe's email is J.Simpson@netwrix.com."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -41,7 +41,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_email(self, blue_vi_gpt_model):
         user_message = "John Doe's email is J.Simpson@netwrix.com."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -53,7 +53,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_bsn(self, blue_vi_gpt_model):
         user_message = "His BSN is 123456789."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -65,7 +65,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_address(self, blue_vi_gpt_model):
         user_message = "His home address is 10 Langelo."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -77,7 +77,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_zip(self, blue_vi_gpt_model):
         user_message = "His ZIP code is 7666MC."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -88,7 +88,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_mastercard(self, blue_vi_gpt_model):
         user_message = "His MasterCard number is 5258704108753590."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -100,7 +100,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_visa(self, blue_vi_gpt_model):
         user_message = "His Visa number is 4563-7568-5698-4587."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -112,7 +112,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_iban(self, blue_vi_gpt_model):
         user_message = "His IBAN number is NL91ABNA0417164300."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -124,7 +124,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_dob(self, blue_vi_gpt_model):
         user_message = "His date of birth is 01/01/1990."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -136,7 +136,7 @@ class TestAnonymization:
     @pytest.mark.asyncio
     async def test_get_anonymized_ip_address(self, blue_vi_gpt_model):
         user_message = "His IP address is 192.168.1.1."
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 
@@ -158,7 +158,7 @@ class TestAnonymization:
             "His date of birth is 01/01/1990. "
             "His IP address is 192.168.1.1."
         )
-        response = blue_vi_gpt_model.assistant.get_anonymized_message(
+        response = await blue_vi_gpt_model.assistant.get_anonymized_message(
             user_message
         )
 